@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 import logging
 import json
@@ -14,6 +15,7 @@ class AzureContentUnderstandingClient:
         subscription_key: str = None,
         token_provider: callable = None,
         x_ms_useragent: str = "cu-sample-code",
+        max_connections: int = 10,
     ):
         if not subscription_key and not token_provider:
             raise ValueError(
@@ -30,6 +32,12 @@ class AzureContentUnderstandingClient:
         self._headers = self._get_headers(
             subscription_key, token_provider(), x_ms_useragent
         )
+        self._session = requests.Session()
+        # Cap the pool so concurrent callers sharing this client block for a
+        # free connection instead of opening new sockets to the endpoint.
+        adapter = HTTPAdapter(pool_maxsize=max_connections, pool_block=True)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _get_analyzer_url(self, endpoint, api_version, analyzer_id):
         return f"{endpoint}/contentunderstanding/analyzers/{analyzer_id}?api-version={api_version}"  # noqa
@@ -80,7 +88,7 @@ class AzureContentUnderstandingClient:
         Raises:
             requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
-        response = requests.get(
+        response = self._session.get(
             url=self._get_analyzer_list_url(self._endpoint, self._api_version),
             headers=self._headers,
         )
@@ -101,7 +109,7 @@ class AzureContentUnderstandingClient:
         Raises:
             HTTPError: If the request fails.
         """
-        response = requests.get(
+        response = self._session.get(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=self._headers,
         )
@@ -152,7 +160,7 @@ class AzureContentUnderstandingClient:
         headers = {"Content-Type": "application/json"}
         headers.update(self._headers)
 
-        response = requests.put(
+        response = self._session.put(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=headers,
             json=analyzer_template,
@@ -174,7 +182,7 @@ class AzureContentUnderstandingClient:
         Raises:
             HTTPError: If the delete request fails.
         """
-        response = requests.delete(
+        response = self._session.delete(
             url=self._get_analyzer_url(self._endpoint, self._api_version, analyzer_id),
             headers=self._headers,
         )
@@ -197,34 +205,31 @@ class AzureContentUnderstandingClient:
             ValueError: If the file location is not a valid path or URL.
             HTTPError: If the HTTP request returned an unsuccessful status code.
         """
-        data = None
         if Path(file_location).exists():
-            with open(file_location, "rb") as file:
-                data = file.read()
             headers = {"Content-Type": "application/octet-stream"}
+            headers.update(self._headers)
+            # Pass the open file so requests streams it instead of holding
+            # the whole payload in memory.
+            with open(file_location, "rb") as file:
+                response = self._session.post(
+                    url=self._get_analyze_url(
+                        self._endpoint, self._api_version, analyzer_id
+                    ),
+                    headers=headers,
+                    data=file,
+                )
         elif "https://" in file_location or "http://" in file_location:
-            data = {"url": file_location}
             headers = {"Content-Type": "application/json"}
-        else:
-            raise ValueError("File location must be a valid path or URL.")
-
-        headers.update(self._headers)
-        if isinstance(data, dict):
-            response = requests.post(
+            headers.update(self._headers)
+            response = self._session.post(
                 url=self._get_analyze_url(
                     self._endpoint, self._api_version, analyzer_id
                 ),
                 headers=headers,
-                json=data,
+                json={"url": file_location},
             )
         else:
-            response = requests.post(
-                url=self._get_analyze_url(
-                    self._endpoint, self._api_version, analyzer_id
-                ),
-                headers=headers,
-                data=data,
-            )
+            raise ValueError("File location must be a valid path or URL.")
 
         response.raise_for_status()
         self._logger.info(
@@ -252,7 +257,7 @@ class AzureContentUnderstandingClient:
             f"{operation_location}/images/{image_id}?api-version={self._api_version}"
         )
         try:
-            response = requests.get(url=image_retrieval_url, headers=self._headers)
+            response = self._session.get(url=image_retrieval_url, headers=self._headers)
             response.raise_for_status()
 
             assert response.headers.get("Content-Type") == "image/jpeg"
@@ -299,7 +304,7 @@ class AzureContentUnderstandingClient:
                     f"Operation timed out after {timeout_seconds:.2f} seconds."
                 )
 
-            response = requests.get(operation_location, headers=self._headers)
+            response = self._session.get(operation_location, headers=self._headers)
             response.raise_for_status()
             status = response.json().get("status").lower()
             if status == "succeeded":
@@ -315,3 +320,9 @@ class AzureContentUnderstandingClient:
                     f"Request {operation_location.split('/')[-1].split('?')[0]} in progress ..."
                 )
             time.sleep(polling_interval_seconds)
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()